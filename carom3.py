@@ -12,7 +12,17 @@ from kivymd.uix.expansionpanel import MDExpansionPanel, MDExpansionPanelOneLine
 import random
 import math
 import os
+from collections import deque
+from fractions import Fraction
+from itertools import accumulate, islice
 from kivy.utils import platform
+from kivy.clock import Clock
+
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 class Tab(MDBoxLayout, MDTabsBase):
@@ -30,6 +40,90 @@ def is_windows():
     return platform == 'win'
 
 
+def _parse_finite(text, default):
+    """Parse a typed-in float, falling back to default for invalid or non-finite input."""
+    try:
+        value = float(text or default)
+    except ValueError:
+        return default
+    return value if math.isfinite(value) else default
+
+
+def _exact_ratio(value):
+    """Return a typed-in decimal value as an exact Fraction."""
+    return Fraction(str(value))
+
+
+def _score_needed(current_score, total_turns, numerator, denominator):
+    """Return the score needed to average numerator / denominator over total_turns."""
+    # Integer ceiling division, so targets like 0.905 stay exact
+    return max(0, -((current_score * denominator - numerator * total_turns) // denominator))
+
+
+def _python_needed_grid(current_score, played_turns, targets, num_turns):
+    """Return a grid of needed scores for exact Fraction targets, as lists."""
+    turns = range(played_turns + 1, played_turns + num_turns + 1)
+    return [
+        [_score_needed(current_score, t, target.numerator, target.denominator) for t in turns]
+        for target in targets
+    ]
+
+
+if njit is not None:
+    _compiled_score_needed = njit(cache=True)(_score_needed)
+
+    @njit(cache=True)
+    def _compiled_needed_grid(current_score, played_turns, numerators, denominators, num_turns):
+        """Compiled variant of _python_needed_grid over target numerators and denominators."""
+        grid = np.empty((len(numerators), num_turns), np.int64)
+        for i in range(len(numerators)):
+            for j in range(num_turns):
+                grid[i, j] = _compiled_score_needed(
+                    current_score, played_turns + j + 1, numerators[i], denominators[i]
+                )
+        return grid
+else:
+    _compiled_needed_grid = None
+
+# The compiled grid only pays off for long sweeps, and its JIT compile must
+# stay off the startup path. Each product in _score_needed must stay below
+# COMPILED_MAX_TERM so their difference cannot overflow int64.
+COMPILED_MIN_TURNS = 100
+COMPILED_MAX_TERM = 2 ** 62
+
+
+def _fits_compiled_grid(current_score, played_turns, targets, num_turns):
+    """Check that the compiled grid cannot overflow int64 for these inputs."""
+    max_turns = abs(played_turns) + num_turns
+    return all(
+        abs(t.numerator) * max_turns < COMPILED_MAX_TERM
+        and abs(current_score) * t.denominator < COMPILED_MAX_TERM
+        for t in targets
+    )
+
+
+def _stepped_targets(base_target, target_step):
+    """Return the three stepped targets as exact Fractions."""
+    base = _exact_ratio(base_target)
+    step = _exact_ratio(target_step)
+    return (base, base + step, base + step * 2)
+
+
+def _needed_grid(current_score, played_turns, targets, num_turns):
+    """Return a grid of scores needed to reach each exact target over num_turns."""
+    if (_compiled_needed_grid is not None and num_turns >= COMPILED_MIN_TURNS
+            and _fits_compiled_grid(current_score, played_turns, targets, num_turns)):
+        grid = _compiled_needed_grid(
+            current_score,
+            played_turns,
+            np.array([t.numerator for t in targets], np.int64),
+            np.array([t.denominator for t in targets], np.int64),
+            num_turns
+        )
+        return grid.tolist()
+    return _python_needed_grid(current_score, played_turns, targets, num_turns)
+
+
 class CaromModel:
     """Model class that holds all application state."""
     
@@ -37,6 +131,8 @@ class CaromModel:
     UPDATE_ENTERING_SCORE = 1
     DEFAULT_TARGET = 0.90
     DEFAULT_TARGET_STEP = 0.10
+    NEEDED_CACHE_SIZE = 64
+    MOYENNES_FILE = '/storage/emulated/0/Pydroid 3/carom_scores.txt'
     
     def __init__(self):
         # Game state
@@ -47,42 +143,89 @@ class CaromModel:
         self.num_zero_scores = 0
         self.input_state = self.START_ENTERING_SCORE
         self.add_score_value = 0
+        self._current_moyenne = 0.0
         
         # Moyennes list
         self.moyennes_list = self._load_moyennes()
+        self._num_new_moyennes = 0
+        self._moyennes_prefix = list(accumulate(self.moyennes_list, initial=0.0))
+        
+        # show_needed results keyed on its arguments
+        self._needed_cache = {}
     
     def _load_moyennes(self):
         """Load moyennes from file on Android or generate random values."""
+        # Only real moyennes may be written back to the file, never the random defaults
+        self._moyennes_loaded = False
+        self._moyennes_file_missing = False
         if is_android():
-            file_path = '/storage/emulated/0/Pydroid 3/carom_scores.txt'
-            if os.path.exists(file_path):
+            file_path = self.MOYENNES_FILE
+            if not os.path.exists(file_path):
+                self._moyennes_file_missing = True
+            else:
                 try:
                     with open(file_path, 'r') as f:
                         moyennes = [float(line.strip()) for line in f.readlines()[:20]]
                         while len(moyennes) < 20:
                             moyennes.append(1.00)
-                        return moyennes
+                        self._moyennes_loaded = True
+                        return deque(moyennes, maxlen=20)
                 except (IOError, ValueError):
                     pass
         
         # Default: random values
-        return [round(random.uniform(0.5, 2.0), 2) for _ in range(20)]
+        return deque((round(random.uniform(0.5, 2.0), 2) for _ in range(20)), maxlen=20)
+    
+    def save_moyennes(self, path, count=None):
+        """Write the newest count moyennes (all by default) to file, replacing it atomically."""
+        if count is None:
+            count = len(self.moyennes_list)
+        moyennes = islice(self.moyennes_list, len(self.moyennes_list) - count, None)
+        tmp_path = path + '.tmp'
+        try:
+            with open(tmp_path, 'w') as f:
+                f.write("\n".join(f"{m:.2f}" for m in moyennes) + "\n")
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, path)
+        except IOError:
+            try:
+                os.remove(tmp_path)
+            except IOError:
+                pass
+    
+    def _store_moyennes(self):
+        """Persist moyennes on Android, unless the file exists but could not be read."""
+        if not is_android():
+            return
+        if self._moyennes_loaded:
+            self.save_moyennes(self.MOYENNES_FILE)
+        elif self._moyennes_file_missing:
+            # Only moyennes added since startup are real, the rest are random defaults
+            self.save_moyennes(self.MOYENNES_FILE, min(self._num_new_moyennes, len(self.moyennes_list)))
     
     def get_current_moyenne(self):
-        """Calculate current game moyenne."""
+        """Return the current game moyenne."""
+        return self._current_moyenne
+    
+    def update_current_moyenne(self):
+        """Recalculate the cached current game moyenne after score or turns change."""
         if self.played_turns > 0:
-            return self.current_score / self.played_turns
-        return 0.0
+            self._current_moyenne = self.current_score / self.played_turns
+        else:
+            self._current_moyenne = 0.0
     
     def get_avg_moyenne(self):
         """Calculate average of moyennes list."""
         if not self.moyennes_list:
             return 0.0
-        return sum(self.moyennes_list) / len(self.moyennes_list)
+        return self._moyennes_prefix[-1] / len(self.moyennes_list)
     
     def get_score_target(self):
         """Calculate score target based on average moyenne."""
-        return math.floor(25.0 * self.get_avg_moyenne())
+        if not self.moyennes_list:
+            return 0
+        return math.floor(25.0 * (self._moyennes_prefix[-1] / len(self.moyennes_list)))
     
     def add_to_score(self, points):
         """Add points to current score and increment turns."""
@@ -90,6 +233,8 @@ class CaromModel:
             self.num_zero_scores += 1
         self.current_score += points
         self.played_turns += 1
+        self.update_current_moyenne()
+        self._needed_cache.clear()
     
     def reset_game(self):
         """Reset current game state."""
@@ -98,19 +243,28 @@ class CaromModel:
         self.num_zero_scores = 0
         self.input_state = self.START_ENTERING_SCORE
         self.add_score_value = 0
+        self._current_moyenne = 0.0
+        self._needed_cache.clear()
     
     def end_game(self):
         """End game and add moyenne to list."""
         if self.played_turns > 0:
             game_moyenne = self.get_current_moyenne()
-            self.moyennes_list.pop(0)
-            self.moyennes_list.append(round(game_moyenne, 2))
+            self._push_moyenne(round(game_moyenne, 2))
+            self._store_moyennes()
         self.reset_game()
     
     def add_moyenne_to_list(self, moyenne):
         """Add a moyenne to the FIFO list."""
-        self.moyennes_list.pop(0)
+        self._push_moyenne(moyenne)
+        self._store_moyennes()
+    
+    def _push_moyenne(self, moyenne):
+        """Append a moyenne, rebuilding the prefix sums from the list."""
+        # The bounded deque drops the oldest moyenne on append
         self.moyennes_list.append(moyenne)
+        self._num_new_moyennes += 1
+        self._moyennes_prefix = list(accumulate(self.moyennes_list, initial=0.0))
     
     def update_input_digit(self, digit):
         """Update the add score input with a digit."""
@@ -130,10 +284,8 @@ class CaromModel:
     
     def score_needed_by_turn(self, current_score, played_turns, target_score, target_turns):
         """Calculate score needed in target_turns to achieve target_score."""
-        i = 0
-        while (current_score + i) * 100 < (100 * target_score * (played_turns + target_turns)):
-            i += 1
-        return i
+        target = _exact_ratio(target_score)
+        return _score_needed(current_score, played_turns + target_turns, target.numerator, target.denominator)
     
     def show_needed_for_perc(self, score, played_turns, target, num_turns=10):
         """Show needed scores for a specific percentage target."""
@@ -150,11 +302,19 @@ class CaromModel:
         return result
     
     def show_needed(self, current_score, played_turns, target_score, target_step, num_turns=10):
-        """Show needed scores for multiple target percentages."""
-        result = []
-        target_scores = [target_score + target_step * i for i in range(3)]
-        for target in target_scores:
-            result.append(self.show_needed_for_perc(current_score, played_turns, target, num_turns))
+        """Show needed scores for multiple target percentages.
+        
+        Returns the three stepped targets and a 3 x num_turns grid of needed scores.
+        """
+        key = (current_score, played_turns, target_score, target_step, num_turns)
+        if key in self._needed_cache:
+            return self._needed_cache[key]
+        targets = _stepped_targets(target_score, target_step)
+        needed = _needed_grid(current_score, played_turns, targets, num_turns)
+        result = (tuple(map(float, targets)), needed)
+        if len(self._needed_cache) >= self.NEEDED_CACHE_SIZE:
+            self._needed_cache.clear()
+        self._needed_cache[key] = result
         return result
     
     def calc_expected_games(self, num_games, targ_moyenne=None):
@@ -164,7 +324,10 @@ class CaromModel:
         if len(self.moyennes_list) < 20:
             return 0.0
         
-        result = (20.0 * targ_moyenne - sum(self.moyennes_list[-(20 - num_games):])) / num_games
+        # Only the most recent 20 - num_games moyennes remain after num_games more games
+        prefix = self._moyennes_prefix
+        remaining = prefix[-1] - prefix[len(self.moyennes_list) - (20 - num_games)]
+        result = (20.0 * targ_moyenne - remaining) / num_games
         return max(0.0, result)
 
 
@@ -174,6 +337,8 @@ class CaromApp(MDApp):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.model = CaromModel()
+        # Coalesces needed-score refreshes requested within one frame
+        self._refresh_trigger = Clock.create_trigger(self._do_refresh)
         
     def build(self):
         screen = Screen()
@@ -187,9 +352,11 @@ class CaromApp(MDApp):
         game_tab = Tab(title="game")
         tabs.add_widget(game_tab)
         
-        # Create second tab (overall)
-        overall_tab = Tab(title="overall")
-        tabs.add_widget(overall_tab)
+        # Create second tab (overall), its content is built on first selection
+        self._overall_tab = Tab(title="overall")
+        self._overall_built = False
+        tabs.add_widget(self._overall_tab)
+        tabs.bind(on_tab_switch=self._maybe_build_overall)
         
         # Move existing content to game tab
         general_layout = MDBoxLayout(orientation='vertical')
@@ -290,89 +457,19 @@ class CaromApp(MDApp):
         
         ### Input score fields
 
-        self.score_1_button = MDRectangleFlatButton(
-            text="1",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(1)
-        )
-        num_pad_layout.add_widget(self.score_1_button)
-
-        self.score_2_button = MDRectangleFlatButton(
-            text="2",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(2)
-        )
-        num_pad_layout.add_widget(self.score_2_button)
-
-        self.score_3_button = MDRectangleFlatButton(
-            text="3",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(3)
-        )
-        num_pad_layout.add_widget(self.score_3_button)
-
-        self.score_4_button = MDRectangleFlatButton(
-            text="4",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(4)
-        )
-        num_pad_layout.add_widget(self.score_4_button)
-
-        self.score_5_button = MDRectangleFlatButton(
-            text="5",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(5)
-        )
-        num_pad_layout.add_widget(self.score_5_button)
-
-        self.score_6_button = MDRectangleFlatButton(
-            text="6",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(6)
-        )
-        num_pad_layout.add_widget(self.score_6_button)
-
-        self.score_7_button = MDRectangleFlatButton(
-            text="7",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(7)
-        )
-        num_pad_layout.add_widget(self.score_7_button)
-
-        self.score_8_button = MDRectangleFlatButton(
-            text="8",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(8)
-        )
-        num_pad_layout.add_widget(self.score_8_button)
-
-        self.score_9_button = MDRectangleFlatButton(
-            text="9",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(9)
-        )
-        num_pad_layout.add_widget(self.score_9_button)
-
-        self.score_reset_button = MDRectangleFlatButton(
-            text="x",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=self.reset_input_score
-        )
-        num_pad_layout.add_widget(self.score_reset_button)
-
-        self.score_0_button = MDRectangleFlatButton(
-            text="0",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=lambda x: self.update_score_input(0)
-        )
-        num_pad_layout.add_widget(self.score_0_button)
-
-        self.score_undo_button = MDRectangleFlatButton(
-            text="<",
-            pos_hint={"center_x": 0.5, "center_y": 0.3},
-            on_release=self.undo_score_input
-        )
-        num_pad_layout.add_widget(self.score_undo_button)
+        # Keys in grid order, the non-digit keys map to their handlers
+        num_pad_keys = [1, 2, 3, 4, 5, 6, 7, 8, 9, "x", 0, "<"]
+        key_actions = {"x": self.reset_input_score, "<": self.undo_score_input}
+        for key in num_pad_keys:
+            button = MDRectangleFlatButton(
+                text=str(key),
+                pos_hint={"center_x": 0.5, "center_y": 0.3}
+            )
+            if key in key_actions:
+                button.fbind('on_release', key_actions[key])
+            else:
+                button.fbind('on_release', self._on_digit, key)
+            num_pad_layout.add_widget(button)
 
         ### Add score fields
         add_score_input_layout = AnchorLayout(anchor_x='right')
@@ -381,7 +478,8 @@ class CaromApp(MDApp):
             pos_hint={"center_x": 0.25},
             size_hint_x=None,
             width=200,
-            text=str(self.model.add_score_value)
+            text=str(self.model.add_score_value),
+            readonly=True
         )
         add_score_input_layout.add_widget(self.add_score_input)
         add_score_layout.add_widget(add_score_input_layout)
@@ -405,32 +503,42 @@ class CaromApp(MDApp):
             )
             self.result_layout.add_widget(label)
             
-        # Generate 3 rows for target scores 90, 100, 110, creating an instance variable for each entry with 
+        # Generate 3 rows for target scores 90, 100, 110, keeping each label in a list
+        # so refreshes can index them directly
+        self._target_labels = []
+        self._target_turn_labels = []
         target = self.model.target
         step = self.model.target_step
         for i in range(3):
             target_score = float(target) + float(i)*step
-            target_label= f'target_{i}'
-            # In the provided code snippet, `vars()[target_label]` is used to dynamically create
-            # instance variables based on the value of `target_label`.
-            setattr(self, target_label, MDLabel(
-                        text=str(target_score),
-                        halign="center"
-                    )
+            target_label = MDLabel(
+                text=str(target_score),
+                halign="center"
             )
-            self.result_layout.add_widget(getattr(self, target_label))
+            self.result_layout.add_widget(target_label)
+            self._target_labels.append(target_label)
+            turn_labels = []
             for j in range(self.NUM_RESULT_COLS):
-                target_turn_label = f'target_turn_{i}_{j}'
-                setattr(self, target_turn_label, MDLabel(
-                        text="0",
-                        halign="center"
-                )
+                target_turn_label = MDLabel(
+                    text="0",
+                    halign="center"
                 )
-                self.result_layout.add_widget(getattr(self, target_turn_label))
+                self.result_layout.add_widget(target_turn_label)
+                turn_labels.append(target_turn_label)
+            self._target_turn_labels.append(turn_labels)
         
-        # Add content to overall tab
+        self.calculate_needed_scores(None)
+        return screen
+    
+    def _maybe_build_overall(self, instance_tabs, instance_tab, *args):
+        """Build the overall tab content the first time it is selected."""
+        if instance_tab is self._overall_tab and not self._overall_built:
+            self._build_overall_tab()
+    
+    def _build_overall_tab(self):
+        """Create the overall tab widgets."""
         overall_layout = MDBoxLayout(orientation='vertical', padding=10, spacing=10)
-        overall_tab.add_widget(overall_layout)
+        self._overall_tab.add_widget(overall_layout)
         
         # Input section (positioned above the list)
         input_section = MDBoxLayout(
@@ -491,26 +599,15 @@ class CaromApp(MDApp):
         )
         overall_layout.add_widget(projections_section)
         
-        self.projection_0_field = MDTextField(
-            hint_text="Target 0",
-            text="",
-            disabled=True
-        )
-        projections_section.add_widget(self.projection_0_field)
-        
-        self.projection_1_field = MDTextField(
-            hint_text="Target 1",
-            text="",
-            disabled=True
-        )
-        projections_section.add_widget(self.projection_1_field)
-        
-        self.projection_2_field = MDTextField(
-            hint_text="Target 2",
-            text="",
-            disabled=True
-        )
-        projections_section.add_widget(self.projection_2_field)
+        self._projection_fields = []
+        for i in range(3):
+            projection_field = MDTextField(
+                hint_text=f"Target {i}",
+                text="",
+                disabled=True
+            )
+            projections_section.add_widget(projection_field)
+            self._projection_fields.append(projection_field)
         
         # Create scrollable content for expansion panel
         scroll_content = MDScrollView(size_hint_y=None, height=300)
@@ -523,8 +620,17 @@ class CaromApp(MDApp):
         )
         scroll_content.add_widget(self.moyennes_display_layout)
         
-        # Populate the list
-        self.update_moyennes_display()
+        # Create one label per moyenne once, refreshes only update their text
+        self._moyenne_labels = []
+        for _ in self.model.moyennes_list:
+            label = MDLabel(
+                text="",
+                halign="left",
+                size_hint_y=None,
+                height=30
+            )
+            self.moyennes_display_layout.add_widget(label)
+            self._moyenne_labels.append(label)
         
         # Create collapsible expansion panel
         self.moyennes_panel = MDExpansionPanel(
@@ -535,9 +641,10 @@ class CaromApp(MDApp):
             )
         )
         overall_layout.add_widget(self.moyennes_panel)
+        self._overall_built = True
         
-        self.calculate_needed_scores(None)
-        return screen
+        # Populate the list
+        self.update_moyennes_display()
     
     # View update methods
     def on_score_changed(self, instance):
@@ -546,6 +653,7 @@ class CaromApp(MDApp):
             self.model.current_score = int(self.score_input.text or 0)
         except ValueError:
             self.model.current_score = 0
+        self.model.update_current_moyenne()
         self.update_view()
     
     def on_turns_changed(self, instance):
@@ -554,25 +662,20 @@ class CaromApp(MDApp):
             self.model.played_turns = int(self.turns_input.text or 0)
         except ValueError:
             self.model.played_turns = 0
+        self.model.update_current_moyenne()
         self.update_view()
     
     def on_target_changed(self, instance):
         """Update model when target input changes."""
-        try:
-            self.model.target = float(self.target_input.text or self.model.DEFAULT_TARGET)
-        except ValueError:
-            self.model.target = self.model.DEFAULT_TARGET
+        self.model.target = _parse_finite(self.target_input.text, self.model.DEFAULT_TARGET)
         self.update_view()
-        self.update_moyennes_display()
+        self._refresh_projections()
     
     def on_target_step_changed(self, instance):
         """Update model when target step input changes."""
-        try:
-            self.model.target_step = float(self.target_step_input.text or self.model.DEFAULT_TARGET_STEP)
-        except ValueError:
-            self.model.target_step = self.model.DEFAULT_TARGET_STEP
+        self.model.target_step = _parse_finite(self.target_step_input.text, self.model.DEFAULT_TARGET_STEP)
         self.update_view()
-        self.update_moyennes_display()
+        self._refresh_projections()
     
     def update_view(self):
         """Update all view elements from model state."""
@@ -583,7 +686,7 @@ class CaromApp(MDApp):
         self.on_target_changed(instance)
         
     def calculate_needed_scores(self, instance):
-        results = self.model.show_needed(
+        targets, needed = self.model.show_needed(
             self.model.current_score,
             self.model.played_turns,
             self.model.target,
@@ -591,23 +694,23 @@ class CaromApp(MDApp):
         )
         
         
-        for i, res in enumerate(results):
-            target = res[0]['target']
-            getattr(self, f'target_{i}').text = str(target)
-            for j, r in enumerate(res):
-                if j < self.NUM_RESULT_COLS:
-                    target_turn_label = f'target_turn_{i}_{j}'
-                    getattr(self, target_turn_label).text = f"{r['needed_score']}"
+        # Only assign changed strings, every .text assignment dispatches a redraw
+        for i, target in enumerate(targets):
+            label = self._target_labels[i]
+            text = str(target)
+            if label.text != text:
+                label.text = text
+            row = needed[i]
+            for j, turn_label in enumerate(self._target_turn_labels[i]):
+                text = str(row[j])
+                if turn_label.text != text:
+                    turn_label.text = text
     
     def add_score(self, instance):
         """Add score from input to game."""
-        try:
-            add_score = int(self.add_score_input.text)
-            self.model.add_to_score(add_score)
-            self.model.reset_input()
-            self.sync_view_from_model()
-        except ValueError:
-            pass
+        self.model.add_to_score(self.model.add_score_value)
+        self.model.reset_input()
+        self.sync_view_from_model()
 
     def reset_game(self, instance):
         """Reset the current game."""
@@ -624,16 +727,26 @@ class CaromApp(MDApp):
         """Reset the add score input."""
         self.model.reset_input()
         self.model.num_zero_scores = 0
-        self.sync_view_from_model()
+        # Neither value feeds the needed-score grid, so skip the full sync
+        self._sync_add_score_only()
+        self.update_summary_scores()
+
+    def _on_digit(self, digit, *args):
+        """Handle a numpad digit button release."""
+        self.update_score_input(digit)
 
     def update_score_input(self, num):
         """Update the score input with a digit."""
         self.model.update_input_digit(num)
-        self.add_score_input.text = str(self.model.add_score_value)
+        self._sync_add_score_only()
 
     def undo_score_input(self, instance):
         """Undo last digit in score input."""
         self.model.undo_input_digit()
+        self._sync_add_score_only()
+    
+    def _sync_add_score_only(self):
+        """Synchronize only the add score field from model state."""
         self.add_score_input.text = str(self.model.add_score_value)
     
     def sync_view_from_model(self):
@@ -643,6 +756,10 @@ class CaromApp(MDApp):
         self.add_score_input.text = str(self.model.add_score_value)
         self.current_moyenne_label.text = f"{self.model.get_current_moyenne():.2f}"
         self.num_zeros_label.text = str(self.model.num_zero_scores)
+        self._refresh_trigger()
+    
+    def _do_refresh(self, dt):
+        """Run the deferred needed-score refresh."""
         self.calculate_needed_scores(None)
             
     def update_summary_scores(self):
@@ -652,16 +769,23 @@ class CaromApp(MDApp):
     
     def update_moyennes_display(self):
         """Update the display of moyennes list."""
-        self.moyennes_display_layout.clear_widgets()
-        for i, moyenne in enumerate(self.model.moyennes_list, 1):
-            label = MDLabel(
-                text=f"{i}. {moyenne:.2f}",
-                halign="left",
-                size_hint_y=None,
-                height=30
-            )
-            self.moyennes_display_layout.add_widget(label)
-        
+        if not self._overall_built:
+            return
+        self._refresh_moyenne_labels()
+        self._refresh_projections()
+    
+    def _refresh_moyenne_labels(self):
+        """Update the moyenne list labels."""
+        for i, moyenne in enumerate(self.model.moyennes_list):
+            label = self._moyenne_labels[i]
+            text = f"{i + 1}. {moyenne:.2f}"
+            if label.text != text:
+                label.text = text
+    
+    def _refresh_projections(self):
+        """Update the statistics and target projection fields."""
+        if not self._overall_built:
+            return
         # Update statistics fields
         avg = self.model.get_avg_moyenne()
         target = self.model.get_score_target()
@@ -674,10 +798,14 @@ class CaromApp(MDApp):
         
         for i in range(3):
             stepped_target = base_target + (i * step)
-            expected_games = self.model.calc_expected_games(1, float(stepped_target))
-            projection_field = getattr(self, f'projection_{i}_field')
-            projection_field.hint_text = f"Target {stepped_target}:"
-            projection_field.text = f"{expected_games:.2f}"
+            expected_games = self.model.calc_expected_games(1, stepped_target)
+            projection_field = self._projection_fields[i]
+            hint_text = f"Target {stepped_target}:"
+            if projection_field.hint_text != hint_text:
+                projection_field.hint_text = hint_text
+            text = f"{expected_games:.2f}"
+            if projection_field.text != text:
+                projection_field.text = text
     
     def add_moyenne(self, instance):
         """Add a new moyenne using FIFO (removes oldest, adds newest)."""
@@ -0,0 +1,186 @@
+import math
+import os
+import tempfile
+import unittest
+from fractions import Fraction
+from unittest import mock
+
+try:
+    import carom3
+except ImportError:
+    carom3 = None
+
+
+@unittest.skipIf(carom3 is None, "kivy/kivymd not installed")
+class NeededGridTest(unittest.TestCase):
+    """Checks for the needed-score grid helpers."""
+
+    TARGETS = [(0.9, 0.1), (0.905, 0.1), (0.875, 0.125), (1.125, 0.05), (0.333, 0.001)]
+
+    def expected_grid(self, current_score, played_turns, base_target, target_step, num_turns):
+        base = Fraction(str(base_target))
+        step = Fraction(str(target_step))
+        return [
+            [max(0, math.ceil((base + step * i) * (played_turns + t) - current_score))
+             for t in range(1, num_turns + 1)]
+            for i in range(3)
+        ]
+
+    def test_score_needed_by_turn_is_exact(self):
+        model = carom3.CaromModel()
+        self.assertEqual(model.score_needed_by_turn(0, 20, 0.905, 1), 20)
+        self.assertEqual(model.score_needed_by_turn(0, 0, 1.1, 10), 11)
+        self.assertEqual(model.score_needed_by_turn(30, 10, 0.9, 5), 0)
+
+    def test_show_needed_returns_stepped_targets(self):
+        targets, needed = carom3.CaromModel().show_needed(0, 0, 0.9, 0.1, 3)
+        self.assertEqual(targets, (0.9, 1.0, 1.1))
+        self.assertEqual(needed, [[1, 2, 3], [1, 2, 3], [2, 3, 4]])
+
+    def test_parse_finite_rejects_non_finite_targets(self):
+        self.assertEqual(carom3._parse_finite("0.95", 0.9), 0.95)
+        self.assertEqual(carom3._parse_finite("", 0.9), 0.9)
+        self.assertEqual(carom3._parse_finite("abc", 0.9), 0.9)
+        for text in ("nan", "inf", "-inf", "1e400"):
+            self.assertEqual(carom3._parse_finite(text, 0.9), 0.9)
+
+    def test_needed_grid_is_exact(self):
+        for current_score in range(0, 40, 7):
+            for played_turns in range(0, 30, 6):
+                for base_target, target_step in self.TARGETS:
+                    self.assertEqual(
+                        carom3._needed_grid(
+                            current_score, played_turns, carom3._stepped_targets(base_target, target_step), 10
+                        ),
+                        self.expected_grid(current_score, played_turns, base_target, target_step, 10)
+                    )
+
+    def test_long_grid_with_huge_target_is_exact(self):
+        num_turns = carom3.COMPILED_MIN_TURNS
+        self.assertFalse(carom3._fits_compiled_grid(5, 3, [Fraction(10 ** 17)], num_turns))
+        self.assertEqual(
+            carom3._needed_grid(5, 3, carom3._stepped_targets(1e17, 0.1), num_turns),
+            self.expected_grid(5, 3, 1e17, 0.1, num_turns)
+        )
+
+    @unittest.skipIf(carom3 is None or carom3._compiled_needed_grid is None, "numba not installed")
+    def test_compiled_grid_matches_python_grid(self):
+        for current_score in range(0, 40, 7):
+            for played_turns in range(0, 30, 6):
+                for base_target, target_step in self.TARGETS:
+                    targets = carom3._stepped_targets(base_target, target_step)
+                    compiled = carom3._compiled_needed_grid(
+                        current_score,
+                        played_turns,
+                        carom3.np.array([t.numerator for t in targets], carom3.np.int64),
+                        carom3.np.array([t.denominator for t in targets], carom3.np.int64),
+                        carom3.COMPILED_MIN_TURNS
+                    )
+                    self.assertEqual(
+                        compiled.tolist(),
+                        carom3._python_needed_grid(
+                            current_score, played_turns, targets, carom3.COMPILED_MIN_TURNS
+                        )
+                    )
+
+
+
+@unittest.skipIf(carom3 is None, "kivy/kivymd not installed")
+class MoyennesTest(unittest.TestCase):
+    """Checks for the moyennes list statistics."""
+
+    def make_model(self, moyennes):
+        model = carom3.CaromModel()
+        for moyenne in moyennes:
+            model.add_moyenne_to_list(moyenne)
+        return model
+
+    def test_moyennes_list_is_bounded_fifo(self):
+        model = self.make_model(range(25))
+        self.assertEqual(list(model.moyennes_list), list(range(5, 25)))
+        model.current_score = 9
+        model.played_turns = 6
+        model.update_current_moyenne()
+        model.end_game()
+        self.assertEqual(list(model.moyennes_list), list(range(6, 25)) + [1.5])
+
+    def test_average_follows_pushes(self):
+        model = self.make_model([1.0] * 20)
+        self.assertAlmostEqual(model.get_avg_moyenne(), 1.0)
+        model.add_moyenne_to_list(3.0)
+        self.assertAlmostEqual(model.get_avg_moyenne(), 1.1)
+
+    def test_calc_expected_games_uses_remaining_tail(self):
+        model = self.make_model([1.0] * 10 + [2.0] * 10)
+        # After one more game the oldest 1.0 drops out, leaving 9 * 1.0 + 10 * 2.0
+        self.assertAlmostEqual(model.calc_expected_games(1, 1.5), 20 * 1.5 - 29.0)
+        self.assertAlmostEqual(model.calc_expected_games(10, 2.0), (40.0 - 20.0) / 10)
+        # After 20 more games none of the current moyennes remain
+        self.assertAlmostEqual(model.calc_expected_games(20, 1.5), 1.5)
+
+    def test_score_target_matches_floor_of_average(self):
+        moyennes = [0.19, 1.28, 2.07, 1.9, 2.3, 1.24, 2.05, 2.9, 2.79, 2.49,
+                    1.88, 1.31, 0.05, 2.18, 1.53, 2.01, 0.23, 2.38, 0.77, 1.25]
+        self.assertEqual(self.make_model(moyennes).get_score_target(), 41)
+
+    def test_score_target_floors_negative_average(self):
+        self.assertEqual(self.make_model([-0.5] * 20).get_score_target(), -13)
+
+
+@unittest.skipIf(carom3 is None, "kivy/kivymd not installed")
+class MoyennesFileTest(unittest.TestCase):
+    """Checks for loading and saving the moyennes file on Android."""
+
+    def setUp(self):
+        tmp_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmp_dir.cleanup)
+        self.path = os.path.join(tmp_dir.name, 'carom_scores.txt')
+        for patcher in (mock.patch.object(carom3, 'is_android', return_value=True),
+                        mock.patch.object(carom3.CaromModel, 'MOYENNES_FILE', self.path)):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def write_file(self, text):
+        with open(self.path, 'w') as f:
+            f.write(text)
+
+    def read_file(self):
+        with open(self.path) as f:
+            return f.read()
+
+    def test_round_trip(self):
+        self.write_file("".join(f"{i / 10:.2f}\n" for i in range(20)))
+        model = carom3.CaromModel()
+        model.add_moyenne_to_list(1.23)
+        model.current_score = 9
+        model.played_turns = 6
+        model.update_current_moyenne()
+        model.end_game()
+        reloaded = carom3.CaromModel()
+        self.assertEqual(list(reloaded.moyennes_list), [i / 10 for i in range(2, 20)] + [1.23, 1.5])
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+    def test_unreadable_file_is_not_overwritten(self):
+        self.write_file("1.50\nnot a number\n")
+        model = carom3.CaromModel()
+        model.add_moyenne_to_list(1.23)
+        self.assertEqual(self.read_file(), "1.50\nnot a number\n")
+
+    def test_missing_file_saves_only_new_moyennes(self):
+        model = carom3.CaromModel()
+        model.add_moyenne_to_list(1.23)
+        model.add_moyenne_to_list(0.75)
+        self.assertEqual(self.read_file(), "1.23\n0.75\n")
+        reloaded = carom3.CaromModel()
+        self.assertEqual(list(reloaded.moyennes_list), [1.23, 0.75] + [1.0] * 18)
+
+    def test_failed_save_removes_tmp_file(self):
+        model = carom3.CaromModel()
+        # Replacing a directory with a file fails after the tmp file is written
+        os.mkdir(self.path)
+        model.save_moyennes(self.path)
+        self.assertFalse(os.path.exists(self.path + '.tmp'))
+
+
+if __name__ == '__main__':
+    unittest.main()